@@ -1,8 +1,9 @@
 """
 Main application class that coordinates all components.
 """
+from functools import partial
 from config import PI_HOST
-from app.constants import LIVE_MAX_WIDTH, PHOTO_MAX_WIDTH
+from app.constants import LIVE_MAX_WIDTH, PHOTO_MAX_WIDTH, STATUS_POLL_MS
 from ui.main_window import MainWindow
 from communication.socket_client import SocketClientManager
 from control.drive_controller import DriveController
@@ -15,7 +16,6 @@ from services.photo_service import PhotoService
 from services.status_service import StatusService
 from services.settings_service import SettingsService
 from services.detection_service import DetectionService
-from utils.images import banner_image
 
 
 class RobotControlApp:
@@ -25,12 +25,8 @@ class RobotControlApp:
         # Application state
         self.running = True
         
-        # Create waiting banner
-        self.waiting_banner = banner_image(
-            ["Waiting for server…", "Press Q to quit."], 
-            w=LIVE_MAX_WIDTH, 
-            h=int(LIVE_MAX_WIDTH * 0.75)
-        )
+        # Waiting banner text (drawn by the video panels' canvases)
+        self.waiting_banner = ("Waiting for server…", "Press Q to quit.")
         
         # Initialize UI FIRST (like original code)
         self._init_ui()
@@ -46,8 +42,8 @@ class RobotControlApp:
         # Setup initial UI state
         self._setup_initial_ui()
         
-        # Start status polling
-        self.window.after(1000, self._poll_status)
+        # Slow status poll; the server pushes changes, this only catches a missed push
+        self.window.after(STATUS_POLL_MS, self._poll_status)
     
     def _init_ui(self):
         """Initialize the main window and UI components."""
@@ -105,30 +101,29 @@ class RobotControlApp:
         self.status_service._update_ui_status = self._apply_status_updates
         
         self.settings_service = SettingsService(self.socket_client, self._ui_status)
-        self.settings_service._on_status_update = self.status_service._on_status_response
         
         self.drive_controller = DriveController(self.socket_client, self._ui_status)
         self.drive_controller._on_ack_update_status = self.status_service._on_status_response
         
-        self.servo_controller = ServoController(self.socket_client)
+        self.servo_controller = ServoController(self.socket_client, self.window.after)
         self.servo_controller._on_ack_update_status = self.status_service._on_status_response
         
         # Initialize vision components after socket client
         self.frame_processor = FrameProcessor(
-            self.detector, 
-            self.annotator, 
             self.window.after,
             None  # detection_service will be set after photo_service
         )
         
         # Connect frame processor callbacks to UI
-        self.frame_processor._show_live_frame = lambda frame: self.window.show_live_frame(frame, LIVE_MAX_WIDTH)
-        self.frame_processor._show_annotated_frame = lambda frame: self.window.show_annotated_frame(frame, LIVE_MAX_WIDTH)
+        # (partials rather than lambdas: these run per frame and skip a Python call layer)
+        self.frame_processor._encode_live_frame = partial(self.window.encode_live_frame, max_width=LIVE_MAX_WIDTH)
+        self.frame_processor._show_live_frame = partial(self.window.show_live_encoded, max_width=LIVE_MAX_WIDTH)
         
         # Initialize photo service after frame processor
         self.photo_service = PhotoService(
             lambda: self.frame_processor.last_frame_bgr,
-            lambda frame: self.window.show_photo(frame, PHOTO_MAX_WIDTH)
+            lambda frame: self.window.show_photo(frame, PHOTO_MAX_WIDTH),
+            self._ui_status
         )
         
         # Initialize detection service after photo service
@@ -140,7 +135,7 @@ class RobotControlApp:
         )
         
         # Connect detection service callbacks
-        self.detection_service._show_annotated_frame = lambda frame: self.window.show_annotated_frame(frame, LIVE_MAX_WIDTH)
+        self.detection_service._show_annotated_frame = partial(self.window.show_annotated_frame, max_width=LIVE_MAX_WIDTH)
         self.detection_service._update_status = self._ui_status
         
         # Update frame processor with detection service
@@ -165,15 +160,13 @@ class RobotControlApp:
     def _on_connect(self):
         """Handle socket connection."""
         self.window.set_connected_status(PI_HOST)
-        try:
-            self.socket_client.emit("get_status", callback=self.status_service._on_status_response)
-        except Exception:
-            pass
+        self.socket_client.emit("get_status", callback=self.status_service._on_status_response)
     
     def _on_disconnect(self):
         """Handle socket disconnection."""
         self.window.set_disconnected_status()
-        self.window.after(0, lambda: self.window.show_waiting_banner(self.waiting_banner, LIVE_MAX_WIDTH))
+        self.frame_processor.reset()
+        self.window.after(0, partial(self.window.show_waiting_banner, self.waiting_banner, LIVE_MAX_WIDTH))
     
     def _on_connect_error(self, err):
         """Handle socket connection error."""
@@ -181,7 +174,7 @@ class RobotControlApp:
     
     def _on_status(self, data):
         """Handle status update from server."""
-        self.window.after(0, lambda d=data: self.status_service.apply_status_dict(d))
+        self.status_service._on_status_response(data)
     
     def _on_video_frame(self, jpg_bytes):
         """Handle video frame from server."""
@@ -210,29 +203,15 @@ class RobotControlApp:
     
     def _on_speed_change(self, percent):
         """Handle speed change."""
-        self.settings_service.set_speed_limit_debounced(
-            percent, 
-            self.window.after, 
-            self.window.after_cancel
-        )
+        self.settings_service.set_speed_limit_debounced(percent, self.window.after)
     
     def _on_trim_left_change(self, percent):
         """Handle left trim change."""
-        self.settings_service.set_trim_debounced(
-            "L", 
-            percent, 
-            self.window.after, 
-            self.window.after_cancel
-        )
+        self.settings_service.set_trim_debounced("L", percent, self.window.after)
     
     def _on_trim_right_change(self, percent):
         """Handle right trim change."""
-        self.settings_service.set_trim_debounced(
-            "R", 
-            percent, 
-            self.window.after, 
-            self.window.after_cancel
-        )
+        self.settings_service.set_trim_debounced("R", percent, self.window.after)
     
     def _choose_folder(self):
         """Handle folder selection."""
@@ -245,7 +224,7 @@ class RobotControlApp:
     # Status and UI updates
     def _ui_status(self, text):
         """Update UI status."""
-        self.window.after(0, lambda t=text: self.window.update_status(t))
+        self.window.after(0, partial(self.window.update_status, text))
     
     def _apply_status_updates(self, status_text, speed_updates, trim_updates):
         """Apply status updates to UI."""
@@ -264,12 +243,16 @@ class RobotControlApp:
         """Poll server for status updates."""
         if self.running:
             self.status_service.poll_status()
-            self.window.after(1000, self._poll_status)
+            self.window.after(STATUS_POLL_MS, self._poll_status)
     
     # Application lifecycle
     def on_close(self):
         """Handle application close."""
         self.running = False
+        try:
+            self.frame_processor.stop()
+        except:
+            pass
         try:
             self.drive_controller.stop()
         except:
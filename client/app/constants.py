@@ -7,9 +7,14 @@ MODEL = "final"  # YOLO model name (in models/{MODEL}.pt)
 # UI Constants
 LIVE_MAX_WIDTH = 640
 PHOTO_MAX_WIDTH = 320
+BANNER_FONT = ("Arial", -22)  # negative size => pixels
+MAX_RENDER_FPS = 30  # cap on live-panel redraws
+STATUS_FLUSH_MS = 200  # status label refreshes at most this often (latest status wins)
+STATUS_POLL_MS = 5000  # fallback get_status; the server pushes status on every change
 
 # Control Constants  
 STEP_DEG = 2.0
+SLIDER_FLUSH_MS = 100  # slider moves are sent at most this often (latest value wins)
 
 # Colors
 BG_COLOR = "#111"
@@ -21,3 +26,4 @@ MUTED_TEXT_COLOR = "#aaa"
 STATUS_BG_COLOR = "#161616"
 HIGHLIGHT_COLOR = "#333"
 TROUGH_COLOR = "#222"
+BANNER_TEXT_COLOR = "#c8c8c8"
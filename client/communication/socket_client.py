@@ -1,10 +1,15 @@
 """
 Socket.IO client setup using the original working approach.
 """
+import queue
 import socketio
 import threading
 from config import API_BASE
 
+# Events that carry absolute state: only the newest queued one is worth sending
+# (set_state is partial - speed and/or trim - so every one must go out)
+LATEST_WINS_EVENTS = ("drive_bin",)
+
 
 class SocketClientManager:
     """Manages Socket.IO client exactly like the original working code."""
@@ -13,8 +18,20 @@ class SocketClientManager:
         self.app = app_instance
         self.connected = False
         
+        # Outgoing events are sent from one worker so the Tk thread never blocks on the socket
+        self._send_q = queue.Queue()
+        self._newest = {}
+        threading.Thread(target=self._send_loop, daemon=True).start()
+        
         # Create client exactly like original code - AFTER Tkinter is initialized
-        self.sio = socketio.Client(reconnection=True, logger=False, engineio_logger=False)
+        # Short reconnect backoff: the Pi is on the LAN, so a dropped link is usually back quickly
+        self.sio = socketio.Client(
+            reconnection=True,
+            reconnection_delay=0.25,
+            reconnection_delay_max=1.5,
+            logger=False,
+            engineio_logger=False,
+        )
         
         # Setup event handlers exactly like original
         self._setup_events()
@@ -60,9 +77,27 @@ class SocketClientManager:
         ).start()
     
     def emit(self, event, data=None, callback=None):
-        """Emit event to server."""
+        """Queue event for the sender thread; returns immediately and never raises.
+
+        Send errors happen on the sender thread and are dropped there.
+        """
         if self.connected:
-            self.sio.emit(event, data, callback=callback)
+            item = (event, data, callback)
+            if event in LATEST_WINS_EVENTS:
+                self._newest[event] = item
+            self._send_q.put(item)
+    
+    def _send_loop(self):
+        """Send queued events in order, skipping ones superseded by a newer copy."""
+        while True:
+            item = self._send_q.get()
+            event, data, callback = item
+            if event in LATEST_WINS_EVENTS and self._newest.get(event) is not item:
+                continue
+            try:
+                self.sio.emit(event, data, callback=callback)
+            except Exception:
+                pass
     
     def disconnect(self):
         """Disconnect from server."""
@@ -1,6 +1,7 @@
 """
 Drive and movement control.
 """
+import struct
 import time
 
 
@@ -13,32 +14,26 @@ class DriveController:
     
     def drive(self, left, right):
         """Send drive command to robot."""
-        try:
-            payload = {
-                "left": float(left),
-                "right": float(right),
-                "client_ts": time.time()
-            }
+        # Two int8 speeds (-127..127); the server's "drive_bin" skips JSON entirely
+        payload = struct.pack(
+            "bb",
+            max(-127, min(127, round(float(left) * 127))),
+            max(-127, min(127, round(float(right) * 127))),
+        )
+        sent_ts = time.perf_counter()
 
-            def on_callback(data):
-                """Handler for the app server callback."""
-                client_ts = data.get("client_ts")
-                if client_ts is not None:
-                    curr_ts = time.time()
-                    latency = (curr_ts - client_ts) * 500  # * 1000 for ms, /2 for round trip
-                    self.status_callback(f"Last motor latency: {latency:.1f} ms")
+        def on_callback(ack):
+            """Handler for the app server callback."""
+            if ack == b"\x01":
+                latency = (time.perf_counter() - sent_ts) * 500  # * 1000 for ms, /2 for round trip
+                self.status_callback(f"Last motor latency: {latency:.1f} ms")
 
-            # Emit data and wait for latency callback from the app server
-            self.socket_client.emit("drive", payload, callback=on_callback)
-        except Exception:
-            self.status_callback("drive error")
+        # Emit data and wait for latency callback from the app server
+        self.socket_client.emit("drive_bin", payload, callback=on_callback)
 
     def stop(self):
         """Stop robot movement."""
-        try:
-            self.socket_client.emit("stop", callback=self._on_ack_update_status)
-        except Exception:
-            self.status_callback("stop error")
+        self.socket_client.emit("stop", callback=self._on_ack_update_status)
     
     def _on_ack_update_status(self, data):
         """Handle status update from server."""
@@ -3,6 +3,18 @@ Input handling and keyboard controls.
 """
 from app.constants import STEP_DEG
 
+# Arrow key -> (left, right) wheel speeds; turns are slower than straight lines
+_DRIVE_SPEEDS = {
+    "Down": (1, 1),
+    "Up": (-1, -1),
+    "Left": (-0.3, 0.3),
+    "Right": (0.3, -0.3),
+}
+_DRIVE_KEYS = frozenset(_DRIVE_SPEEDS)
+
+# Servo key -> nudge in degrees
+_SERVO_NUDGES = {"s": -STEP_DEG, "S": -STEP_DEG, "w": STEP_DEG, "W": STEP_DEG}
+
 
 class InputHandler:
     """Handles keyboard input and converts to control commands."""
@@ -20,19 +32,11 @@ class InputHandler:
         code = event.keysym
         
         # Drive controls
-        if code in ("Up", "Down", "Left", "Right"):
+        if code in _DRIVE_KEYS:
             if code in self.drive_pressed:
                 return
             self.drive_pressed.add(code)
-            
-            if code == "Down":
-                self.drive_controller.drive(1, 1)
-            elif code == "Up":
-                self.drive_controller.drive(-1, -1)
-            elif code == "Left":
-                self.drive_controller.drive(-0.3, 0.3)  # Slower left turn
-            elif code == "Right":
-                self.drive_controller.drive(0.3, -0.3)  # Slower right turn
+            self.drive_controller.drive(*_DRIVE_SPEEDS[code])
             return
         
         # Photo capture
@@ -46,10 +50,9 @@ class InputHandler:
             return
         
         # Servo controls
-        if code in ("s", "S"):
-            self.servo_controller.nudge_angle(-STEP_DEG)
-        elif code in ("w", "W"):
-            self.servo_controller.nudge_angle(STEP_DEG)
+        delta = _SERVO_NUDGES.get(code)
+        if delta is not None:
+            self.servo_controller.nudge_angle(delta)
         elif code in ("q", "Q"):
             self.app_close_callback()
     
@@ -60,5 +63,5 @@ class InputHandler:
             self.drive_pressed.discard(code)
         
         # Stop driving if no drive keys are pressed
-        if not any(k in self.drive_pressed for k in ("Up", "Down", "Left", "Right")):
+        if self.drive_pressed.isdisjoint(_DRIVE_KEYS):
             self.drive_controller.stop()
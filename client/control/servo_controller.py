@@ -1,29 +1,41 @@
 """
 Servo control functionality.
 """
+from app.constants import SLIDER_FLUSH_MS
 
 
 class ServoController:
     """Handles servo control commands."""
     
-    def __init__(self, socket_client):
+    def __init__(self, socket_client, after_callback):
         self.socket_client = socket_client
+        self.after_callback = after_callback
+        
+        # Nudges from key repeat add up here and go out as one delta per SLIDER_FLUSH_MS
+        self._pending_delta = 0.0
+        self._flush_scheduled = False
     
     def set_angle(self, angle_deg: float):
         """Set servo to specific angle."""
-        try:
-            self.socket_client.emit("servo_set", {"angle": float(angle_deg)}, 
-                                   callback=self._on_ack_update_status)
-        except Exception:
-            pass
+        self._pending_delta = 0.0  # an absolute angle supersedes queued nudges
+        self.socket_client.emit("servo_set", {"angle": float(angle_deg)}, 
+                               callback=self._on_ack_update_status)
 
     def nudge_angle(self, delta_deg: float):
-        """Nudge servo by delta angle."""
-        try:
-            self.socket_client.emit("servo_set", {"delta": float(delta_deg)}, 
-                                   callback=self._on_ack_update_status)
-        except Exception:
-            pass
+        """Nudge servo by delta angle, coalesced with other nudges."""
+        self._pending_delta += float(delta_deg)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after_callback(SLIDER_FLUSH_MS, self._flush_nudge)
+    
+    def _flush_nudge(self):
+        """Send the summed nudges since the last flush as one servo_set."""
+        delta, self._pending_delta = self._pending_delta, 0.0
+        self._flush_scheduled = False
+        if not delta:
+            return
+        # Fire-and-forget: the ack carries only the angle, which nothing displays
+        self.socket_client.emit("servo_set", {"delta": delta})
     
     def _on_ack_update_status(self, data):
         """Handle status update from server."""
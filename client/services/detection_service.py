@@ -1,10 +1,14 @@
 """
 Detection service for manual object detection.
 """
-import cv2
+import os
+import threading
+from collections import deque
 import numpy as np
 from pathlib import Path
 from datetime import datetime
+from functools import partial
+from utils.images import save_bgr_async
 
 
 class DetectionService:
@@ -21,28 +25,52 @@ class DetectionService:
         
         # Current frame for detection
         self.current_frame = None
+        
+        # Inference runs on its own thread so the Tk loop never waits on the model;
+        # presses while it is busy just replace the frame waiting to be detected
+        self._detect_slot = deque(maxlen=1)
+        self._detect_ready = threading.Event()
+        threading.Thread(target=self._detect_loop, daemon=True).start()
     
     def update_frame(self, frame_bgr):
         """Update the current frame for detection."""
         self.current_frame = frame_bgr
     
     def trigger_detection(self):
-        """Manually trigger detection on current frame."""
+        """Manually trigger detection on current frame; returns immediately."""
         if self.current_frame is None:
             return
-        
+        self._detect_slot.append(self.current_frame)
+        self._detect_ready.set()
+    
+    def _detect_loop(self):
+        """Run detection on the newest triggered frame (detection thread)."""
+        # Pay the model's one-time setup here, before the first D press
+        self.detector.warmup()
+        while True:
+            self._detect_ready.wait()
+            self._detect_ready.clear()
+            try:
+                frame = self._detect_slot.popleft()
+            except IndexError:
+                continue
+            self._run_detection(frame)
+    
+    def _run_detection(self, frame):
+        """Detect, annotate, display and save one frame."""
         # Run detection on original frame (same orientation as training data)
         try:
-            results = self.detector.predict(self.current_frame)
+            results = self.detector.predict(frame)
             if results is not None:
-                annotated = self.annotator.draw_detections(self.current_frame, results, self.detector.names)
+                annotated = self.annotator.draw_detections(frame, results, self.detector.names)
             else:
-                annotated = self.current_frame.copy()
+                # Decoded frames are never written to after publishing, so share it
+                annotated = frame
         except Exception as e:
-            annotated = self.annotator.draw_error_message(self.current_frame, str(e))
+            annotated = self.annotator.draw_error_message(frame, str(e))
         
         # Show annotated frame in second window
-        self.ui_update_callback(0, lambda: self._show_annotated_frame(annotated))
+        self.ui_update_callback(0, partial(self._show_annotated_frame, annotated))
         
         # Save the annotated image
         self._save_detection_image(annotated)
@@ -59,18 +87,20 @@ class DetectionService:
             filename = f"detection_{timestamp}.jpg"
             
             # Get save directory from photo service
-            save_dir = self.photo_service.save_directory
-            filepath = save_dir / filename
+            filepath = os.path.join(self.photo_service.save_dir_str, filename)
             
-            # Save the image
-            cv2.imwrite(str(filepath), annotated_frame)
+            # Encode + write on the background writer; the annotated frame is ours alone
+            if save_bgr_async(annotated_frame, filepath):
+                message = f"Detection saved: {filename}"
+            else:
+                message = "Save error: writer is busy"
             
             # Update UI status
-            self.ui_update_callback(0, lambda: self._update_status(f"Detection saved: {filename}"))
+            self.ui_update_callback(0, partial(self._update_status, message))
             
         except Exception as e:
             error_msg = f"Save error: {e}"
-            self.ui_update_callback(0, lambda: self._update_status(error_msg))
+            self.ui_update_callback(0, partial(self._update_status, error_msg))
     
     def _update_status(self, message):
         """Update status - to be connected by main app."""
@@ -1,19 +1,22 @@
 """
 Photo capture and management service.
 """
+import os
 from pathlib import Path
 from tkinter import filedialog, messagebox
 from config import SAVE_DIR
-from utils.images import ts_filename, save_bgr
+from utils.images import ts_filename, save_bgr_async
 
 
 class PhotoService:
     """Handles photo capture and saving functionality."""
     
-    def __init__(self, get_current_frame_callback, update_photo_display_callback):
+    def __init__(self, get_current_frame_callback, update_photo_display_callback, status_callback):
         self.save_dir = SAVE_DIR
+        self.save_dir_str = str(SAVE_DIR)  # joined with os.path.join on every save
         self.get_current_frame = get_current_frame_callback
         self.update_photo_display = update_photo_display_callback
+        self.status_callback = status_callback
     
     def choose_folder(self):
         """Open folder selection dialog."""
@@ -23,6 +26,7 @@ class PhotoService:
         )
         if d:
             self.save_dir = Path(d)
+            self.save_dir_str = str(self.save_dir)
             return self.save_dir
         return None
     
@@ -33,14 +37,16 @@ class PhotoService:
             messagebox.showwarning("No frame", "No video frame available yet.")
             return False
         
-        out_path = self.save_dir / ts_filename("photo", "jpg")
-        if save_bgr(current_frame, out_path):
-            self.update_photo_display(current_frame)
-            print(f"Saved: {out_path}")
-            return True
-        else:
-            print("Failed to save image.")
+        out_path = os.path.join(self.save_dir_str, ts_filename("photo", "jpg"))
+        # Re-encode rather than keep the stream JPEG: the stream is tuned for
+        # bandwidth (low quality), photos should look good. Encode + disk write
+        # happen on the saver threads, not the Tk thread.
+        if not save_bgr_async(current_frame, out_path):
+            self.status_callback("Photo not saved: writer is busy")
             return False
+        self.update_photo_display(current_frame)
+        print(f"Saved: {out_path}")
+        return True
     
     def get_save_directory_text(self):
         """Get formatted save directory text for display."""
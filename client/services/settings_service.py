@@ -1,6 +1,7 @@
 """
 Settings and configuration management service.
 """
+from app.constants import SLIDER_FLUSH_MS
 
 
 class SettingsService:
@@ -10,58 +11,40 @@ class SettingsService:
         self.socket_client = socket_client
         self.status_callback = status_callback
         
-        # Debounce handles for slider updates
-        self._speed_job = None
-        self._trim_left_job = None
-        self._trim_right_job = None
+        # Latest slider value per setting, sent by one flush per SLIDER_FLUSH_MS
+        self._pending = {}
+        self._flush_scheduled = False
     
-    def set_speed_limit_debounced(self, percent, after_callback, cancel_callback):
-        """Set speed limit with debouncing."""
-        if self._speed_job:
-            cancel_callback(self._speed_job)
-        
-        def emit_speed():
-            self._emit_set_speed_limit(percent / 100.0)
-        
-        self._speed_job = after_callback(150, emit_speed)
+    def set_speed_limit_debounced(self, percent, after_callback):
+        """Set speed limit, coalesced with other slider moves."""
+        self._queue_setting(("speed",), percent / 100.0, after_callback)
     
-    def set_trim_debounced(self, side, percent, after_callback, cancel_callback):
-        """Set wheel trim with debouncing."""
-        job_attr = f"_trim_{side.lower()}_job"
-        current_job = getattr(self, job_attr, None)
-        
-        if current_job:
-            cancel_callback(current_job)
-        
-        def emit_trim():
-            self._emit_set_trim(side, percent / 100.0)
-        
-        new_job = after_callback(150, emit_trim)
-        setattr(self, job_attr, new_job)
+    def set_trim_debounced(self, side, percent, after_callback):
+        """Set wheel trim, coalesced with other slider moves."""
+        self._queue_setting(("trim", side), percent / 100.0, after_callback)
     
-    def _emit_set_speed_limit(self, fraction):
-        """Emit speed limit change to server."""
-        try:
-            self.socket_client.emit(
-                "set_speed_limit",
-                {"speed_limit": float(fraction)},
-                callback=self._on_status_update
-            )
-        except Exception:
-            pass
+    def _queue_setting(self, key, value, after_callback):
+        """Remember the newest value for key; arm a single flush if none is pending."""
+        self._pending[key] = value
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            after_callback(SLIDER_FLUSH_MS, self._flush_pending)
     
-    def _emit_set_trim(self, side, value):
-        """Emit trim change to server."""
-        try:
-            self.socket_client.emit(
-                "set_trim", 
-                {side: float(value)}, 
-                callback=self._on_status_update
-            )
-        except Exception:
-            pass
+    def _flush_pending(self):
+        """Send every setting that moved since the last flush in one set_state message."""
+        pending, self._pending = self._pending, {}
+        self._flush_scheduled = False
+        state = {}
+        for key, value in pending.items():
+            if key[0] == "speed":
+                state["speed_limit"] = float(value)
+            else:
+                state.setdefault("trim", {})[key[1]] = float(value)
+        if state:
+            self._emit_set_state(state)
     
-    def _on_status_update(self, data):
-        """Handle status update response."""
-        # This will be connected to the status service
-        pass
+    def _emit_set_state(self, state):
+        """Emit combined speed limit / trim change to server (no ack; the server broadcasts status)."""
+        if not self.socket_client.connected:
+            return
+        self.socket_client.emit("set_state", state)
@@ -1,74 +1,81 @@
 """
 Status management and server communication service.
 """
+from app.constants import STATUS_FLUSH_MS
+
+_STATUS_FMT = "L: dir {} duty {} | R: dir {} duty {}"
+_EMPTY = {}
+
+
+def _fmt_duty(x):
+    return f"{x:.2f}" if isinstance(x, (float, int)) else x
 
 
 class StatusService:
-    """Handles status polling and management."""
+    """Handles server status updates."""
     
     def __init__(self, socket_client, ui_update_callback):
         self.socket_client = socket_client
         self.ui_update_callback = ui_update_callback
         self.servo_angle = 0.0
+        
+        # Coalesce status responses: only the latest is rendered
+        self._pending_status = None
+        self._scheduled = False
     
     def poll_status(self):
-        """Poll server for status updates."""
+        """Ask the server for status (slow fallback in case a push was missed)."""
         if self.socket_client.connected:
-            try:
-                self.socket_client.emit("get_status", callback=self._on_status_response)
-            except Exception:
-                pass
+            self.socket_client.emit("get_status", callback=self._on_status_response)
     
     def _on_status_response(self, data):
-        """Handle status response from server."""
-        self.ui_update_callback(0, lambda d=data: self.apply_status_dict(d))
+        """Handle status response from server (any thread); applied at most every STATUS_FLUSH_MS."""
+        self._pending_status = data
+        if not self._scheduled:
+            self._scheduled = True
+            self.ui_update_callback(STATUS_FLUSH_MS, self._flush)
+    
+    def _flush(self):
+        """Apply only the newest status received since the last flush (UI thread)."""
+        self._scheduled = False
+        data, self._pending_status = self._pending_status, None
+        if data is not None:
+            self.apply_status_dict(data)
     
     def apply_status_dict(self, status_dict: dict):
-        """Apply status dictionary to update UI and internal state."""
+        """Apply status dictionary to update UI and internal state (UI thread)."""
         if not isinstance(status_dict, dict) or not status_dict.get("ok", True):
             return
 
-        # Update motor status display
-        left_info = status_dict.get("left", {})
-        right_info = status_dict.get("right", {})
+        g = status_dict.get
         
-        def format_value(x):
-            return f"{x:.2f}" if isinstance(x, (float, int)) else x
-        
-        status_text = (
-            f"L: dir {left_info.get('dir',0)} duty {format_value(left_info.get('duty',0))} | "
-            f"R: dir {right_info.get('dir',0)} duty {format_value(right_info.get('duty',0))}"
+        # Update motor status display
+        left_info = g("left") or _EMPTY
+        right_info = g("right") or _EMPTY
+        status_text = _STATUS_FMT.format(
+            left_info.get('dir', 0), _fmt_duty(left_info.get('duty', 0)),
+            right_info.get('dir', 0), _fmt_duty(right_info.get('duty', 0)),
         )
         
+        speed_updates = {}
+        trim_updates = {}
         try:
-            # Update speed limit if present
-            speed_updates = {}
-            if "speed_limit" in status_dict:
-                frac = float(status_dict["speed_limit"])
-                pct = int(round(frac * 100))
-                speed_updates = {"speed_percent": pct}
-
-            # Update trims if present
-            trim_updates = {}
-            if "trim" in status_dict and isinstance(status_dict["trim"], dict):
-                trim = status_dict["trim"]
-                if "L" in trim:
-                    trim_updates["left_trim"] = int(round(float(trim["L"]) * 100))
-                if "R" in trim:
-                    trim_updates["right_trim"] = int(round(float(trim["R"]) * 100))
-
-            # Update servo angle if present
-            if isinstance(status_dict.get("servo"), dict) and "angle" in status_dict["servo"]:
-                self.servo_angle = float(status_dict["servo"]["angle"])
-
-            # Send all updates to UI
-            self.ui_update_callback(0, lambda: self._update_ui_status(
-                status_text, speed_updates, trim_updates
-            ))
-            
+            # Speed limit, trims and servo angle, each only if present
+            if (frac := g("speed_limit")) is not None:
+                speed_updates["speed_percent"] = int(round(float(frac) * 100))
+            if isinstance(trim := g("trim"), dict):
+                if (v := trim.get("L")) is not None:
+                    trim_updates["left_trim"] = int(round(float(v) * 100))
+                if (v := trim.get("R")) is not None:
+                    trim_updates["right_trim"] = int(round(float(v) * 100))
+            if isinstance(servo := g("servo"), dict) and "angle" in servo:
+                self.servo_angle = float(servo["angle"])
         except Exception:
             # If parsing fails, at least update the basic status
-            self.ui_update_callback(0, lambda: self._update_ui_status(status_text, {}, {}))
+            speed_updates, trim_updates = {}, {}
+        
+        # Already on the UI thread, so update directly
+        self._update_ui_status(status_text, speed_updates, trim_updates)
     
     def _update_ui_status(self, status_text, speed_updates, trim_updates):
         """Update UI with status information - to be connected by main app."""
@@ -15,8 +15,13 @@ class ControlPanel:
         self.container = create_frame(parent)
         self.container.pack(side=tk.TOP, fill=tk.X, padx=10, pady=6)
         
-        # Suppress programmatic slider callbacks
-        self._suppress_speed_cb = False
+        # Latest raw value per slider; handlers run once per idle, not per step
+        self._scale_latest = {}
+        
+        # Sliders the user is holding (server status must not move them), and
+        # values we set ourselves, whose idle-time command echo is skipped
+        self._dragging = set()
+        self._programmatic = {}
         
         self._create_instruction_label()
         self._create_drive_buttons()
@@ -64,8 +69,8 @@ class ControlPanel:
             to=100, 
             orient="horizontal", 
             length=260,
-            command=self._on_speed_input
         )
+        self._wire_scale(self.speed_scale, self._on_speed_input)
         self.speed_scale.set(50)
         self.speed_scale.pack(side=tk.LEFT)
     
@@ -86,8 +91,8 @@ class ControlPanel:
             to=120,
             orient="horizontal",
             length=260,
-            command=self._on_trim_left_input
         )
+        self._wire_scale(self.trim_left_scale, self._on_trim_left_input)
         self.trim_left_scale.set(100)
         self.trim_left_scale.grid(row=1, column=1, padx=4)
         
@@ -103,8 +108,8 @@ class ControlPanel:
             to=120,
             orient="horizontal",
             length=260,
-            command=self._on_trim_right_input
         )
+        self._wire_scale(self.trim_right_scale, self._on_trim_right_input)
         self.trim_right_scale.set(100)
         self.trim_right_scale.grid(row=2, column=1, padx=4)
         
@@ -121,11 +126,31 @@ class ControlPanel:
         self.save_label = create_muted_label(save, text="")
         self.save_label.pack(side=tk.LEFT, padx=8)
     
+    def _wire_scale(self, scale, handler):
+        """Attach the coalesced command and drag tracking to a slider."""
+        scale.configure(command=self._coalesced(handler, scale))
+        scale.bind("<ButtonPress-1>", lambda e: self._dragging.add(scale), add="+")
+        scale.bind("<ButtonRelease-1>", lambda e: self._dragging.discard(scale), add="+")
+    
+    def _coalesced(self, handler, scale):
+        """Wrap a slider handler so a drag runs it once per idle with the newest value."""
+        def command(value):
+            # Tk runs the command at idle, so a flag set around scale.set() is
+            # already cleared by then; match the value we set instead
+            if self._programmatic.pop(scale, None) == int(float(value)):
+                return
+            pending = handler in self._scale_latest
+            self._scale_latest[handler] = value
+            if not pending:
+                self.container.after_idle(self._run_coalesced, handler)
+        return command
+    
+    def _run_coalesced(self, handler):
+        """Run handler with the newest value its slider reported."""
+        handler(self._scale_latest.pop(handler))
+    
     def _on_speed_input(self, value):
         """Handle speed slider input."""
-        if self._suppress_speed_cb:
-            return
-        
         val = int(float(value))
         self.speed_val.set(f"{val}%")
         self.callbacks["speed_change"](val)
@@ -142,24 +167,29 @@ class ControlPanel:
         self.trim_right_val.set(f"{val/100:.2f}×")
         self.callbacks["trim_right_change"](val)
     
+    def _set_scale(self, scale, percent):
+        """Move a slider from server state; False (untouched) while the user drags it."""
+        if scale in self._dragging:
+            return False
+        if int(float(scale.get())) != percent:
+            self._programmatic[scale] = percent
+            scale.set(percent)
+        return True
+    
     def update_speed(self, percent):
         """Update speed display (without triggering callback)."""
-        self._suppress_speed_cb = True
-        try:
-            self.speed_scale.set(percent)
+        if self._set_scale(self.speed_scale, percent):
             self.speed_val.set(f"{percent}%")
-        finally:
-            self._suppress_speed_cb = False
     
     def update_trim_left(self, percent):
-        """Update left trim display."""
-        self.trim_left_scale.set(percent)
-        self.trim_left_val.set(f"{percent/100:.2f}×")
+        """Update left trim display (without triggering callback)."""
+        if self._set_scale(self.trim_left_scale, percent):
+            self.trim_left_val.set(f"{percent/100:.2f}×")
     
     def update_trim_right(self, percent):
-        """Update right trim display."""
-        self.trim_right_scale.set(percent)
-        self.trim_right_val.set(f"{percent/100:.2f}×")
+        """Update right trim display (without triggering callback)."""
+        if self._set_scale(self.trim_right_scale, percent):
+            self.trim_right_val.set(f"{percent/100:.2f}×")
     
     def update_save_folder_text(self, text):
         """Update save folder display text."""
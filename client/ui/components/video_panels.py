@@ -2,16 +2,53 @@
 Video display panel components.
 """
 import tkinter as tk
-from PIL import Image, ImageTk
 import cv2
 from ui.styles import create_frame, create_panel_frame, create_label, create_button
-from app.constants import BG_COLOR, FRAME_COLOR
+from app.constants import BG_COLOR, FRAME_COLOR, BANNER_FONT, BANNER_TEXT_COLOR
+
+
+class FrameEncoder:
+    """Resizes BGR frames to a max width and encodes them as PPM for tk.PhotoImage.
+
+    Keeps a resize-plan cache, so each instance must be used from one thread only.
+    """
+    
+    def __init__(self, interpolation=cv2.INTER_AREA):
+        self.interpolation = interpolation
+        # Resize target for the last (w, h, max_width) seen; the stream size rarely changes
+        self._resize_key = None
+        self._resize_plan = None
+    
+    def encode(self, bgr, max_width):
+        """Downscale a BGR frame and encode it as PPM; returns (data, width, height) or None."""
+        h, w = bgr.shape[:2]
+        key = (w, h, max_width)
+        if key != self._resize_key:
+            self._resize_key = key
+            self._resize_plan = None
+            if w > max_width:
+                scale = max_width / w
+                # INTER_AREA only pays off from 2x reduction; below that bilinear looks the same
+                interp = self.interpolation if scale <= 0.5 else cv2.INTER_LINEAR
+                self._resize_plan = ((int(w*scale), int(h*scale)), interp)
+        if self._resize_plan is not None:
+            size, interp = self._resize_plan
+            bgr = cv2.resize(bgr, size, interpolation=interp)
+        # cv2's PPM writer emits the P6 header and swaps BGR->RGB in one pass,
+        # and Tk decodes P6 natively, so no PIL image is built per frame
+        ok, ppm = cv2.imencode(".ppm", bgr)
+        if not ok:
+            return None
+        return ppm.tobytes(), bgr.shape[1], bgr.shape[0]
 
 
 class VideoPanel:
     """A video display panel with title and optional controls."""
     
-    def __init__(self, parent, title, add_button=False, button_text="", button_command=None):
+    def __init__(self, parent, title, add_button=False, button_text="", button_command=None,
+                 interpolation=cv2.INTER_AREA):
+        self.interpolation = interpolation
+        self._encoder = FrameEncoder(interpolation)  # UI-thread encodes for this panel
         self.outer_frame = create_frame(parent)
         self.frame = create_panel_frame(self.outer_frame)
         
@@ -24,29 +61,60 @@ class VideoPanel:
         if add_button and button_command:
             create_button(header, button_text, button_command).pack(side=tk.RIGHT)
         
-        # Image display label
-        self.image_label = tk.Label(self.frame, bg=FRAME_COLOR)
-        self.image_label.pack(padx=6, pady=6)
+        # Canvas with one persistent image item and one message item; the
+        # waiting message is drawn by Tk itself and only shown/hidden
+        self.canvas = tk.Canvas(self.frame, bg=BG_COLOR, highlightthickness=0, width=1, height=1)
+        self.canvas.pack(padx=6, pady=6)
+        self._size = (1, 1)
+        self._photo = None
+        self._image_item = self.canvas.create_image(0, 0, anchor=tk.NW)
+        self._message_item = self.canvas.create_text(
+            0, 0, fill=BANNER_TEXT_COLOR, font=BANNER_FONT, justify=tk.CENTER, state=tk.HIDDEN
+        )
+        self._message_shown = False
         
         self.frame.pack(padx=6, pady=6)
     
-    def show_image(self, image_data, max_width):
-        """Display image in the panel."""
-        if isinstance(image_data, Image.Image):
-            im = image_data
+    def _set_size(self, width, height):
+        """Resize the canvas and keep the message centred."""
+        if (width, height) != self._size:
+            self._size = (width, height)
+            self.canvas.configure(width=width, height=height)
+            self.canvas.coords(self._message_item, width // 2, height // 2)
+    
+    def show_bgr(self, bgr, max_width):
+        """Display a BGR numpy frame, downscaled to max_width (hot video path)."""
+        encoded = self.encode(bgr, max_width)
+        if encoded is not None:
+            self.show_ppm(*encoded)
+    
+    def encode(self, bgr, max_width):
+        """Downscale a BGR frame and encode it as PPM; returns (data, width, height) or None."""
+        return self._encoder.encode(bgr, max_width)
+    
+    def show_ppm(self, data, width, height):
+        """Display already-encoded PPM data."""
+        # One PhotoImage per panel; configure(data=...) refills its existing buffer
+        # (Tk only reallocates when the frame grows). Naming the format skips
+        # Tk probing every registered image handler on each frame.
+        if self._photo is None:
+            self._photo = tk.PhotoImage(master=self.canvas, data=data, format="ppm")
+            self.canvas.itemconfigure(self._image_item, image=self._photo)
         else:
-            # Assume BGR numpy array
-            bgr = image_data
-            h, w = bgr.shape[:2]
-            if w > max_width:
-                scale = max_width / w
-                bgr = cv2.resize(bgr, (int(w*scale), int(h*scale)), interpolation=cv2.INTER_AREA)
-            rgb = cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
-            im = Image.fromarray(rgb)
+            self._photo.configure(data=data, format="ppm")
+        self._set_size(width, height)
         
-        imtk = ImageTk.PhotoImage(im)
-        self.image_label.imtk = imtk  # Keep reference to prevent garbage collection
-        self.image_label.configure(image=imtk)
+        if self._message_shown:
+            self._message_shown = False
+            self.canvas.itemconfigure(self._message_item, state=tk.HIDDEN)
+            self.canvas.itemconfigure(self._image_item, state=tk.NORMAL)
+    
+    def show_message(self, text, width, height):
+        """Show a text message in place of the image."""
+        self._set_size(width, height)
+        self.canvas.itemconfigure(self._image_item, state=tk.HIDDEN)
+        self.canvas.itemconfigure(self._message_item, text=text, state=tk.NORMAL)
+        self._message_shown = True
     
     def pack(self, **kwargs):
         """Pack the outer frame."""
@@ -60,9 +128,16 @@ class VideoPanelSet:
         self.container = create_frame(parent)
         self.container.pack(side=tk.TOP, fill=tk.X, padx=10, pady=10)
         
-        # Create three panels
-        self.live_panel = VideoPanel(self.container, "Live video")
-        self.annotated_panel = VideoPanel(self.container, "Annotated video")
+        # (frame, (max_width, interpolation), encoded) of the last frame shown,
+        # so one frame shown in two panels is resized and encoded once
+        self._last_encoded = None
+        
+        # Create three panels; the streaming panels trade a little sharpness for
+        # the cheaper bilinear downscale, the photo panel keeps INTER_AREA
+        self.live_panel = VideoPanel(self.container, "Live video", interpolation=cv2.INTER_LINEAR)
+        # Owned by the decode thread; the Tk thread never touches it
+        self._live_encoder = FrameEncoder(cv2.INTER_LINEAR)
+        self.annotated_panel = VideoPanel(self.container, "Annotated video", interpolation=cv2.INTER_LINEAR)
         self.photo_panel = VideoPanel(
             self.container, 
             "Last photo", 
@@ -76,20 +151,39 @@ class VideoPanelSet:
         self.annotated_panel.pack(side=tk.LEFT, padx=6)
         self.photo_panel.pack(side=tk.LEFT, padx=6)
     
-    def show_live_frame(self, frame, max_width):
-        """Show frame in live panel."""
-        cv2.flip(frame, 0, frame)
-        self.live_panel.show_image(frame, max_width)
+    def _show(self, panel, frame, max_width):
+        """Show frame in panel, reusing the last encode if it was the same frame at the same size."""
+        key = (max_width, panel.interpolation)
+        last = self._last_encoded
+        if last is not None and last[0] is frame and last[1] == key:
+            encoded = last[2]
+        else:
+            encoded = panel.encode(frame, max_width)
+            if encoded is None:
+                return
+            self._last_encoded = (frame, key, encoded)
+        panel.show_ppm(*encoded)
+    
+    def encode_live_frame(self, frame, max_width):
+        """Resize and encode a frame for the live panel (decode thread only; touches no Tk state)."""
+        return self._live_encoder.encode(frame, max_width)
+    
+    def show_live_encoded(self, frame, encoded, max_width):
+        """Show a frame already encoded by encode_live_frame in the live panel."""
+        self._last_encoded = (frame, (max_width, self._live_encoder.interpolation), encoded)
+        self.live_panel.show_ppm(*encoded)
     
     def show_annotated_frame(self, frame, max_width):
         """Show frame in annotated panel."""
-        self.annotated_panel.show_image(frame, max_width)
+        self._show(self.annotated_panel, frame, max_width)
     
     def show_photo(self, frame, max_width):
         """Show frame in photo panel."""
-        self.photo_panel.show_image(frame, max_width)
+        self._show(self.photo_panel, frame, max_width)
     
-    def show_waiting_banner(self, banner_image, max_width):
+    def show_waiting_banner(self, lines, max_width):
         """Show waiting banner in both live and annotated panels."""
-        self.live_panel.show_image(banner_image, max_width)
-        self.annotated_panel.show_image(banner_image, max_width)
+        text = "\n".join(lines)
+        height = int(max_width * 0.75)
+        self.live_panel.show_message(text, max_width, height)
+        self.annotated_panel.show_message(text, max_width, height)
@@ -53,9 +53,13 @@ class MainWindow(tk.Tk):
         self.status_bar = StatusBar(self)
     
     # Video display methods
-    def show_live_frame(self, frame, max_width):
-        """Show frame in live video panel."""
-        self.video_panels.show_live_frame(frame, max_width)
+    def encode_live_frame(self, frame, max_width):
+        """Encode frame for the live panel (safe off the UI thread)."""
+        return self.video_panels.encode_live_frame(frame, max_width)
+    
+    def show_live_encoded(self, frame, encoded, max_width):
+        """Show a pre-encoded frame in live video panel."""
+        self.video_panels.show_live_encoded(frame, encoded, max_width)
     
     def show_annotated_frame(self, frame, max_width):
         """Show frame in annotated video panel."""
@@ -65,9 +69,9 @@ class MainWindow(tk.Tk):
         """Show frame in photo panel."""
         self.video_panels.show_photo(frame, max_width)
     
-    def show_waiting_banner(self, banner_image, max_width):
+    def show_waiting_banner(self, lines, max_width):
         """Show waiting banner in video panels."""
-        self.video_panels.show_waiting_banner(banner_image, max_width)
+        self.video_panels.show_waiting_banner(lines, max_width)
     
     # Control panel updates
     def update_speed_display(self, percent):
@@ -1,37 +1,75 @@
+import os
+import queue
+import threading
 from datetime import datetime
-from pathlib import Path
-from PIL import Image, ImageDraw, ImageFont, ImageTk
 import cv2
 
+try:
+    import simplejpeg  # libjpeg-turbo, encodes BGR directly; faster than cv2.imencode
+except Exception:
+    simplejpeg = None
+
 def ts_filename(prefix="photo", ext="jpg"):
     return f"{prefix}_{datetime.now().strftime('%Y%m%d-%H%M%S_%f')[:-3]}.{ext}"
 
-def pil_from_bgr(bgr):
-    rgb = cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
-    return Image.fromarray(rgb)
+def _encode(frame_bgr, suffix, quality):
+    """Encode a BGR frame for the given file suffix."""
+    if (simplejpeg is not None and suffix.lower() in (".jpg", ".jpeg")
+            and frame_bgr.flags.c_contiguous):
+        return simplejpeg.encode_jpeg(frame_bgr, quality=quality, colorspace="BGR")
+    # IMWRITE_JPEG_OPTIMIZE must be the int 1, not True
+    ok, buf = cv2.imencode(suffix, frame_bgr,
+                           [cv2.IMWRITE_JPEG_QUALITY, quality, cv2.IMWRITE_JPEG_OPTIMIZE, 1])
+    if not ok:
+        raise ValueError("encode failed")
+    return buf
+
+# Two-stage pipeline so the next frame encodes while the previous one is being written:
+# save_bgr_async -> _encode_q -> _encoder thread -> _write_q -> _writer thread
+_encode_q = queue.Queue(maxsize=8)  # bounded: a stalled disk can't pile up frames in RAM
+_write_q = queue.Queue(maxsize=2)
+
+def _encoder():
+    """Encode queued frames (cv2/simplejpeg release the GIL) and pass the bytes on."""
+    while True:
+        frame_bgr, out_path, quality = _encode_q.get()
+        try:
+            suffix = os.path.splitext(out_path)[1] or ".jpg"
+            _write_q.put((out_path, _encode(frame_bgr, suffix, quality)))
+        except Exception as e:
+            print(f"Failed to save {out_path}: {e}")
+
+def _writer():
+    """Write encoded images to disk off the UI thread."""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    while True:
+        out_path, buf = _write_q.get()
+        try:
+            try:
+                fd = os.open(out_path, flags, 0o644)
+            except FileNotFoundError:
+                # folder vanished since it was chosen; recreate it only then
+                os.makedirs(os.path.dirname(out_path), exist_ok=True)
+                fd = os.open(out_path, flags, 0o644)
+            try:
+                view = memoryview(buf).cast("B")  # flat bytes for ndarray or bytes
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+        except Exception as e:
+            print(f"Failed to save {out_path}: {e}")
+
+threading.Thread(target=_encoder, daemon=True).start()
+threading.Thread(target=_writer, daemon=True).start()
 
-def resize_to_width(im: Image.Image, maxw: int) -> Image.Image:
-    if im.width > maxw:
-        ratio = maxw / im.width
-        im = im.resize((maxw, int(im.height * ratio)), Image.LANCZOS)
-    return im
+def save_bgr_async(frame_bgr, out_path, quality=75) -> bool:
+    """Queue a frame for saving; returns immediately. The frame must not be mutated afterwards.
 
-def banner_image(lines, w=640, h=480):
-    img = Image.new("RGB", (w, h), (17, 17, 17))
-    draw = ImageDraw.Draw(img)
+    out_path may be a str or Path. Returns False (frame not saved) if the writer is already 8 frames behind.
+    """
     try:
-        font = ImageFont.truetype("arial.ttf", 22)
-    except Exception:
-        font = ImageFont.load_default()
-    total_h = sum(draw.textbbox((0,0), t, font=font)[3] for t in lines) + 10*(len(lines)-1)
-    y = (h - total_h) // 2
-    for t in lines:
-        tw = draw.textbbox((0,0), t, font=font)[2]
-        x = (w - tw)//2
-        draw.text((x, y), t, fill=(200,200,200), font=font)
-        y += draw.textbbox((0,0), t, font=font)[3] + 10
-    return img
-
-def save_bgr(frame_bgr, out_path: Path) -> bool:
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    return cv2.imwrite(str(out_path), frame_bgr)
+        _encode_q.put_nowait((frame_bgr, out_path, quality))
+        return True
+    except queue.Full:
+        return False
@@ -6,22 +6,28 @@ import cv2
 import numpy as np
 
 
+def _class_color(cls_id: int):
+    """Consistent color for a class ID, from its own seeded RNG (global random untouched)."""
+    rng = random.Random(cls_id + 12345)
+    return (
+        int(50 + 205 * rng.random()),
+        int(50 + 205 * rng.random()),
+        int(50 + 205 * rng.random()),
+    )
+
+
+# Colors for class ids 0..255, built once at import
+_PALETTE = tuple(_class_color(i) for i in range(256))
+
+
 class DetectionAnnotator:
     """Handles drawing bounding boxes and labels on frames."""
     
-    def __init__(self):
-        self._cls_colors = {}  # color palette per class id
-    
     def _get_class_color(self, cls_id: int):
         """Get consistent color for a class ID."""
-        if cls_id not in self._cls_colors:
-            random.seed(cls_id + 12345)
-            self._cls_colors[cls_id] = (
-                int(50 + 205 * random.random()),
-                int(50 + 205 * random.random()),
-                int(50 + 205 * random.random()),
-            )
-        return self._cls_colors[cls_id]
+        if 0 <= cls_id < len(_PALETTE):
+            return _PALETTE[cls_id]
+        return _class_color(cls_id)
     
     def draw_detections(self, frame_bgr, results, class_names=None):
         """Draw boxes/labels on a copy of the frame."""
@@ -44,10 +50,14 @@ class DetectionAnnotator:
         t = max(1, int(round(min(H, W) / 320)))  # thickness scales with image size
         tf = max(0.4, min(0.8, t * 0.4))         # font scale
 
-        for (x1, y1, x2, y2), c, k in zip(xyxy, confs, clses):
-            cls_id = int(k) if k is not None else -1
+        # Convert to plain ints/floats in one vectorized pass each, instead of
+        # unboxing numpy scalars box by box inside the loop
+        xyxy = xyxy.astype(np.int32).tolist()
+        confs = confs.tolist()
+        clses = clses.astype(np.int32).tolist()
+
+        for (x1, y1, x2, y2), c, cls_id in zip(xyxy, confs, clses):
             color = self._get_class_color(cls_id)
-            x1, y1, x2, y2 = map(int, [x1, y1, x2, y2])
 
             # Draw bounding box
             cv2.rectangle(out, (x1, y1), (x2, y2), color, t, cv2.LINE_AA)
@@ -2,6 +2,7 @@
 YOLO object detection functionality.
 """
 from pathlib import Path
+import numpy as np
 from app.constants import MODEL
 
 # Optional: Ultralytics YOLO for detection
@@ -21,6 +22,7 @@ class ObjectDetector:
         self.model = None
         self.names = {}
         self.conf_threshold = 0.25  # Standard YOLO confidence threshold
+        self.half = True  # FP16 inference; Ultralytics only applies it on CUDA, CPU stays FP32
         
         self._init_model()
     
@@ -60,6 +62,7 @@ class ObjectDetector:
                 conf=self.conf_threshold, 
                 verbose=False, 
                 imgsz=640, 
+                half=self.half,
                 device=None
             )
             return results
@@ -67,6 +70,24 @@ class ObjectDetector:
             self.status_callback(f"Detection error: {e}")
             return None
     
+    def warmup(self):
+        """Run one throwaway inference so the first real one skips predictor setup."""
+        if not (self.enabled and self.model):
+            return
+        try:
+            # First predict builds and caches the predictor, moves weights to the
+            # device and fuses layers; later calls reuse all of it
+            self.model.predict(
+                source=np.zeros((480, 640, 3), np.uint8),
+                conf=self.conf_threshold,
+                verbose=False,
+                imgsz=640,
+                half=self.half,
+                device=None
+            )
+        except Exception:
+            pass
+    
     def set_confidence_threshold(self, conf: float):
         """Set confidence threshold for detections."""
         self.conf_threshold = max(0.0, min(1.0, conf))
@@ -2,99 +2,128 @@
 Frame processing pipeline for video and detection.
 """
 import threading
+import time
+from collections import deque
 import numpy as np
 import cv2
+from app.constants import MAX_RENDER_FPS
+
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR  # PyTurboJPEG; SIMD decode, faster than cv2.imdecode
+    _turbo = TurboJPEG()
+except Exception:
+    _turbo = None
+
+if _turbo is None:
+    print("Note: PyTurboJPEG not available; decoding video with cv2.imdecode.")
+
+
+def decode_jpeg(data):
+    """JPEG bytes -> BGR ndarray (None on failure)."""
+    if _turbo is not None:
+        try:
+            return _turbo.decode(data, pixel_format=TJPF_BGR)
+        except Exception:
+            pass
+    return cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
 
 
 class FrameProcessor:
-    """Handles frame processing pipeline with drop-frame rendering and inference."""
+    """Handles the decode/render stages of the video pipeline with drop-frame semantics."""
     
-    def __init__(self, detector, annotator, ui_update_callback, detection_service=None):
-        self.detector = detector
-        self.annotator = annotator
+    def __init__(self, ui_update_callback, detection_service=None):
         self.ui_update_callback = ui_update_callback
         self.detection_service = detection_service
         
         # Frame processing state
         self._render_busy = False
-        self._latest_jpg = None
+        self._next_render = 0.0  # monotonic time before which no redraw is scheduled
+        self._jpeg_ring = deque(maxlen=1)  # newest undecoded JPEG; append drops the older one
+        self._decoded = deque(maxlen=1)  # newest (frame, encoded) awaiting render
+        self._last_jpg = None  # last payload decoded; identical repeats are skipped
         self.last_frame_bgr = None
         
-        # Disable automatic inference
-        self._infer_busy = False
-        self._infer_seq = 0
-        self._latest_for_infer = None  # (frame_bgr, seq)
+        # JPEG decode, resize and PPM encode run on their own thread so the Tk thread only blits
+        self._jpg_ready = threading.Event()
+        self._stop = threading.Event()
+        threading.Thread(target=self._decode_loop, daemon=True).start()
     
     def process_video_frame(self, jpg_bytes):
         """Process incoming video frame (JPEG bytes)."""
-        # Drop old frames, render most recent
-        self._latest_jpg = jpg_bytes
-        if not self._render_busy:
-            self._render_busy = True
-            # Schedule rendering on UI thread
-            self.ui_update_callback(0, self._drain_and_render)
+        # Drop old frames, the decoder only ever takes the most recent
+        self._jpeg_ring.append(jpg_bytes)
+        self._jpg_ready.set()
     
-    def _drain_and_render(self):
-        """Decode and render the latest frame."""
-        data = self._latest_jpg
-        self._latest_jpg = None
-        
-        if data is not None:
-            np_arr = np.frombuffer(data, np.uint8)
-            frame = cv2.imdecode(np_arr, cv2.IMREAD_COLOR)
-            
-            if frame is not None:
-                # Keep last raw frame
-                self.last_frame_bgr = frame
-                
-                # Update detection service with current frame
-                if self.detection_service:
-                    self.detection_service.update_frame(frame)
-                
-                # Show raw frame in live panel
-                self.ui_update_callback(0, lambda: self._show_live_frame(frame))
-
-        # Continue draining if more frames arrived
-        if self._latest_jpg is not None:
-            self.ui_update_callback(0, self._drain_and_render)
-        else:
-            self._render_busy = False
+    def reset(self):
+        """Forget the last frame so the next one is always drawn (e.g. after reconnect)."""
+        self._last_jpg = None
+    
+    def stop(self):
+        """Stop the decode thread."""
+        self._stop.set()
+        self._jpg_ready.set()
     
-    def _start_infer(self):
-        """Spawn an inference worker if not already busy."""
-        if not self.detector.enabled:
-            return
-        if self._infer_busy or self._latest_for_infer is None:
-            return
+    def _decode_loop(self):
+        """Decode and encode the newest JPEG off the UI thread and schedule its render."""
+        while not self._stop.is_set():
+            self._jpg_ready.wait()
+            self._jpg_ready.clear()
+            # popleft() takes and clears the slot in one step, so a frame
+            # arriving in between can't be wiped out
+            try:
+                data = self._jpeg_ring.popleft()
+            except IndexError:
+                continue
+            # Bytewise-identical payload: same pixels, skip decode and redraw
+            # (bytes == is a length check plus memcmp, far cheaper than a decode)
+            if data == self._last_jpg:
+                continue
+            self._last_jpg = data
             
-        frame, seq = self._latest_for_infer
-        self._infer_busy = True
-        threading.Thread(target=self._infer_worker, args=(frame, seq), daemon=True).start()
+            frame = decode_jpeg(data)
+            if frame is None:
+                continue
+            
+            # Live-panel resize/encode happens here too (cv2 releases the GIL),
+            # leaving only the PhotoImage refill for the UI thread
+            self._decoded.append((frame, self._encode_live_frame(frame)))
+            if not self._render_busy:
+                self._render_busy = True
+                # Schedule rendering on UI thread, no more often than MAX_RENDER_FPS;
+                # frames decoded while waiting just replace the one in _decoded
+                delay_ms = max(0, int((self._next_render - time.monotonic()) * 1000))
+                self.ui_update_callback(delay_ms, self._drain_and_render)
     
-    def _infer_worker(self, frame_bgr, seq):
-        """Run model inference and schedule annotated rendering."""
+    def _drain_and_render(self):
+        """Render the latest decoded frame (UI thread)."""
+        # Clear the busy flag before taking the frame: one decoded after this
+        # point schedules its own render, so none is stranded in the slot.
+        # popleft() takes and empties the slot in one step.
+        self._render_busy = False
+        self._next_render = time.monotonic() + 1.0 / MAX_RENDER_FPS
         try:
-            results = self.detector.predict(frame_bgr)
-            if results is not None:
-                annotated = self.annotator.draw_detections(frame_bgr, results, self.detector.names)
-            else:
-                annotated = frame_bgr.copy()
-        except Exception as e:
-            annotated = self.annotator.draw_error_message(frame_bgr, str(e))
-
-        # Push to UI thread
-        self.ui_update_callback(0, lambda img=annotated: self._show_annotated_frame(img))
-
-        # Allow next infer; if a newer frame arrived while we were busy, kick again
-        self._infer_busy = False
-        latest = self._latest_for_infer
-        if latest is not None and latest[1] > seq:
-            self._start_infer()
+            latest = self._decoded.popleft()
+        except IndexError:
+            latest = None
+        
+        if latest is not None:
+            frame, encoded = latest
+            
+            # Keep last raw frame
+            self.last_frame_bgr = frame
+            
+            # Update detection service with current frame
+            if self.detection_service:
+                self.detection_service.update_frame(frame)
+            
+            # Show raw frame in live panel
+            if encoded is not None:
+                self._show_live_frame(frame, encoded)
     
-    def _show_live_frame(self, frame):
-        """Show live frame - to be implemented by UI."""
-        pass
+    def _encode_live_frame(self, frame):
+        """Encode live frame for display (decode thread) - to be implemented by UI."""
+        return None
     
-    def _show_annotated_frame(self, frame):
-        """Show annotated frame - to be implemented by UI."""
+    def _show_live_frame(self, frame, encoded):
+        """Show live frame from its encoding - to be implemented by UI."""
         pass
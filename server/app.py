@@ -1,19 +1,44 @@
 #!/usr/bin/env python3
 # Socket.IO robot server for Raspberry Pi (no watchdog).
 # Motors keep last setpoint until /stop or client disconnect.
-
-import atexit, time, cv2, pigpio
+# With software JPEG (HW_MJPEG off, or no hardware encoder) the producer thread
+# moves itself to CAPTURE_CPU; launch as `taskset -c 0-2 python3 app.py` then so
+# request handling stays off that core. The default hardware MJPEG path encodes
+# on the ISP and pins nothing, so no core needs reserving. Real-time priority
+# needs root or `sudo setcap cap_sys_nice+ep $(readlink -f $(which python3))`.
+
+import atexit, io, os, struct, time, cv2, pigpio
+import numpy as np
 from flask import Flask, jsonify, request
 from flask_socketio import SocketIO
+from libcamera import Transform
 from picamera2 import Picamera2
-from threading import Lock
+from picamera2.encoders import MJPEGEncoder
+from picamera2.outputs import FileOutput
+from threading import Lock, Thread
+
+try:
+    import lgpio  # direct gpiochip access, no pigpiod round trips
+except Exception:
+    lgpio = None
+
+try:
+    import simplejpeg  # libjpeg-turbo via Cython; faster than cv2.imencode
+except Exception:
+    simplejpeg = None
 
 # ===== Tunables =====
 VIDEO_FPS      = 24
 JPEG_QUALITY   = 40
-#DOWNSCALE_TO   = (480, 360)   # None => keep native 640x480
-DOWNSCALE_TO   = (640,480)   # None => keep native 640x480
+#DOWNSCALE_TO   = (480, 360)   # None => keep native 640x480 (scaled by the ISP)
+DOWNSCALE_TO   = (640,480)   # None => keep native 640x480 (scaled by the ISP)
 APPLY_HZ       = 120          # motor apply loop
+CAMERA_HFLIP   = False        # orientation fix done by the ISP, not per frame
+CAMERA_VFLIP   = True         # camera is mounted upside down
+HW_MJPEG       = True         # encode on the Pi's hardware JPEG block, CPU fallback
+MJPEG_BITRATE  = 4_000_000    # only used when HW_MJPEG is on
+CAPTURE_CPU    = 3            # core for the software-JPEG producer thread (None => don't pin)
+CAPTURE_RT_PRIO = 10          # SCHED_RR priority for the producer; needs root or CAP_SYS_NICE
 
 # ================= Server =================
 app = Flask(__name__)
@@ -42,10 +67,37 @@ print("async_mode =", sio.async_mode)
 picam2 = None
 _cam_lock = Lock()
 _clients = set()
+_jpeg_sink = None   # set when the hardware MJPEG encoder is running
+_sw_flip = None     # row/col slice applied per frame if the ISP rejects the transform
+
+# Single-slot frame buffer: the producer overwrites, the emitter reads the newest.
+# One (frame_id, jpeg) tuple swapped by a plain assignment, which is atomic
+# under the GIL, so neither side takes a lock. Only one producer runs at a
+# time (the capture thread or the hardware encoder's sink).
+_frame_slot = (0, None)
+
+def _publish_frame(jpg):
+    """Store one immutable JPEG payload; every emit shares this object."""
+    global _frame_slot
+    _frame_slot = (_frame_slot[0] + 1, jpg)
+
+def _latest_frame():
+    return _frame_slot
+
+class _JpegSink(io.BufferedIOBase):
+    """FileOutput target that publishes each encoded JPEG to the frame slot."""
+
+    def writable(self):
+        return True
+
+    def write(self, buf):
+        # bytes() is free for bytes input and makes Socket.IO send it as a binary attachment
+        _publish_frame(bytes(buf))
+        return len(buf)
 
 def ensure_camera(tries=10, delay=0.4):
     """Open Picamera2 lazily, retry if busy."""
-    global picam2
+    global picam2, _jpeg_sink, _sw_flip
     with _cam_lock:
         if picam2 is not None:
             return picam2
@@ -53,12 +105,33 @@ def ensure_camera(tries=10, delay=0.4):
         for _ in range(tries):
             try:
                 cam = Picamera2()
-                cfg = cam.create_video_configuration(
-                    main={"size": (640,480), "format": "BGR888"},
-                    controls={"FrameRate": VIDEO_FPS},
-                )
-                cam.configure(cfg)
-                cam.start()
+                main = {"size": DOWNSCALE_TO or (640,480), "format": "BGR888"}
+                try:
+                    cam.configure(cam.create_video_configuration(
+                        main=main,
+                        controls={"FrameRate": VIDEO_FPS},
+                        transform=Transform(hflip=CAMERA_HFLIP, vflip=CAMERA_VFLIP),
+                    ))
+                except Exception:
+                    # sensor can't flip; fall back to one strided copy per frame
+                    cam.configure(cam.create_video_configuration(
+                        main=main, controls={"FrameRate": VIDEO_FPS},
+                    ))
+                    if CAMERA_HFLIP or CAMERA_VFLIP:
+                        _sw_flip = (slice(None, None, -1 if CAMERA_VFLIP else 1),
+                                    slice(None, None, -1 if CAMERA_HFLIP else 1))
+                started = False
+                if HW_MJPEG and _sw_flip is None:
+                    try:
+                        sink = _JpegSink()
+                        cam.start_recording(MJPEGEncoder(bitrate=MJPEG_BITRATE), FileOutput(sink))
+                        _jpeg_sink = sink
+                        started = True
+                    except Exception as e:
+                        # no V4L2 M2M JPEG encoder (e.g. Pi 5); encode on the CPU instead
+                        print("hardware MJPEG unavailable, using software encode:", e)
+                if not started:
+                    cam.start()
                 picam2 = cam
                 return cam
             except Exception as e:
@@ -66,25 +139,90 @@ def ensure_camera(tries=10, delay=0.4):
                 time.sleep(delay)
         raise RuntimeError(f"Could not acquire camera: {last_err}")
 
+def _encode_jpeg(frame, quality):
+    """BGR frame -> JPEG bytes (None on failure)."""
+    if simplejpeg is not None:
+        return simplejpeg.encode_jpeg(frame, quality=quality, colorspace="BGR", fastdct=True)
+    # BGR888 goes straight in, so libjpeg-turbo's BGR input path is used
+    ok, jpg = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    return jpg.tobytes() if ok else None
+
+def _pin_capture_thread():
+    """Pin the calling thread to CAPTURE_CPU and raise it to SCHED_RR, best effort."""
+    if CAPTURE_CPU is None:
+        return
+    try:
+        os.sched_setaffinity(0, {CAPTURE_CPU})  # pid 0 => calling thread on Linux
+    except (AttributeError, OSError) as e:
+        print("capture thread not pinned:", e)
+    try:
+        os.sched_setscheduler(0, os.SCHED_RR, os.sched_param(CAPTURE_RT_PRIO))
+    except (AttributeError, OSError):
+        try:
+            os.nice(-10)
+        except OSError:
+            print("capture thread runs at normal priority (no CAP_SYS_NICE)")
+
+def capture_frames():
+    """Producer thread: capture -> JPEG -> frame slot.
+
+    Runs once per camera frame regardless of how many clients are connected.
+    With HW_MJPEG the encoder thread publishes frames itself via _JpegSink.
+    """
+    pinned = False
+    while True:
+        if not _clients:
+            time.sleep(0.1)
+            continue
+        try:
+            cam = ensure_camera()
+            if _jpeg_sink is not None:
+                return  # hardware encoder publishes frames; this thread has no work
+            if not pinned:
+                # only the software path does per-frame work here worth a core
+                _pin_capture_thread()
+                pinned = True
+                if simplejpeg is None:
+                    print("note: simplejpeg not installed; software JPEG encode uses cv2.imencode")
+            frame = cam.capture_array()  # BGR888 at stream size, blocks until the next frame
+            if _sw_flip is not None:
+                frame = np.ascontiguousarray(frame[_sw_flip])
+            jpg = _encode_jpeg(frame, JPEG_QUALITY)
+            if jpg is not None:
+                _publish_frame(jpg)
+        except Exception:
+            time.sleep(0.1)
+
+def _backlogged(sid):
+    """True if a client's engine.io queue still holds an unsent frame."""
+    try:
+        eio_sid = sio.server.manager.eio_sid_from_sid(sid, "/")
+        # a binary emit queues two packets (header + attachment)
+        return sio.server.eio.sockets[eio_sid].queue.qsize() >= 2
+    except Exception:
+        return False
+
 def stream_camera():
-    """Capture -> (optional) resize -> JPEG -> emit newest only."""
-    min_dt = 1.0 / max(1, VIDEO_FPS)
+    """Emit the newest frame from the slot; never re-send the same one.
+
+    Clients that haven't drained the previous frame are skipped for this
+    one, so a slow viewer falls behind by at most one frame instead of
+    building up a queue.
+    """
+    poll_dt = 0.5 / max(1, VIDEO_FPS)
+    last_id = 0
     while True:
-        t0 = time.time()
         try:
             if _clients:
-                cam = ensure_camera()
-                frame = cam.capture_array()  # BGR888
-                if DOWNSCALE_TO:
-                    frame = cv2.resize(frame, DOWNSCALE_TO, interpolation=cv2.INTER_AREA)
-                ok, jpg = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY])
-                if ok:
-                    sio.emit("video_frame", jpg.tobytes(), broadcast=True)
+                frame_id, jpg = _latest_frame()
+                if frame_id != last_id and jpg is not None:
+                    for sid in list(_clients):
+                        if not _backlogged(sid):
+                            sio.emit("video_frame", jpg, to=sid)
+                    last_id = frame_id
         except Exception:
             pass
-        # pace to VIDEO_FPS without busy looping
-        elapsed = time.time() - t0
-        sio.sleep(max(0, min_dt - elapsed))
+        sio.sleep(poll_dt)
 
 # ================= Motors =================
 # Channel A (OUT1/OUT2)
@@ -93,6 +231,8 @@ ENA_A, IN1_A, IN2_A = 12, 19, 26
 ENA_B, IN3_B, IN4_B = 13, 23, 24
 
 PWM_FREQ_HZ = 20000       # 20 kHz avoids audible whine
+USE_LGPIO   = False       # drive motor pins via lgpio instead of pigpiod (servo stays on pigpio)
+LGPIO_PWM_HZ = 10000      # lgpio software PWM tops out at 10 kHz
 
 DUTY_MIN    = 0.16        # overcome friction
 DUTY_MAX    = 0.7
@@ -123,23 +263,42 @@ if not pi.connected:
     raise RuntimeError("pigpio daemon not running. Try: sudo systemctl start pigpiod")
 
 # ----- Configure motor pins -----
-for p in (ENA_A, IN1_A, IN2_A, ENA_B, IN3_B, IN4_B):
-    pi.set_mode(p, pigpio.OUTPUT)
-    pi.write(p, 0)
-
-for pin in (ENA_A, ENA_B):
-    pi.set_PWM_frequency(pin, PWM_FREQ_HZ)
-    pi.set_PWM_range(pin, 255)
-    pi.set_PWM_dutycycle(pin, 0)
-
 STBY = 25
-if STBY is not None:
-    pi.set_mode(STBY, pigpio.OUTPUT)
-    pi.write(STBY, 1)
+_chip = None  # lgpio gpiochip handle when USE_LGPIO is active
+
+_DIR_PINS = (IN1_A, IN2_A, IN3_B, IN4_B)  # written together, one store per update
+
+if USE_LGPIO and lgpio is not None:
+    _chip = lgpio.gpiochip_open(0)
+    for p in (ENA_A, ENA_B):
+        lgpio.gpio_claim_output(_chip, p, 0)
+    lgpio.group_claim_output(_chip, list(_DIR_PINS), [0] * len(_DIR_PINS))
+    if STBY is not None:
+        lgpio.gpio_claim_output(_chip, STBY, 1)
+else:
+    for p in (ENA_A, IN1_A, IN2_A, ENA_B, IN3_B, IN4_B):
+        pi.set_mode(p, pigpio.OUTPUT)
+        pi.write(p, 0)
+
+    for pin in (ENA_A, ENA_B):
+        pi.set_PWM_frequency(pin, PWM_FREQ_HZ)
+        pi.set_PWM_range(pin, 255)
+        pi.set_PWM_dutycycle(pin, 0)
+
+    if STBY is not None:
+        pi.set_mode(STBY, pigpio.OUTPUT)
+        pi.write(STBY, 1)
 
 _motor_lock = Lock()
 _cur = {"L": {"dir": 0, "duty": 0.0}, "R": {"dir": 0, "duty": 0.0}}
 
+# Per-side (ena, inA, inB, polarity), resolved once; index 0 = L, 1 = R.
+# Event handlers keep using "L"/"R"; only the apply loop uses indices.
+_PHYS = {"A": (ENA_A, IN1_A, IN2_A), "B": (ENA_B, IN3_B, IN4_B)}
+MOTORS = tuple(_PHYS[LOGICAL2PHYS[k]] + (POLARITY[k],) for k in ("L", "R"))
+_cur_idx = (_cur["L"], _cur["R"])  # same dicts, reachable without string hashing
+_stop_gen = 0  # bumped by stop_all so the apply loop re-applies even an unchanged setpoint
+
 # ----- Servo setup -----
 pi.set_mode(SERVO_PIN, pigpio.OUTPUT)
 
@@ -159,58 +318,99 @@ def _duty_to_8bit(d):  # 0..1 → 0..255
     d = max(DUTY_MIN, min(DUTY_MAX, float(d)))
     return int(d * 255)
 
-def _pins_for(side):
-    return (ENA_A, IN1_A, IN2_A) if LOGICAL2PHYS[side] == "A" else (ENA_B, IN3_B, IN4_B)
+def _set_pwm(ena, duty8):
+    if _chip is not None:
+        lgpio.tx_pwm(_chip, ena, LGPIO_PWM_HZ, duty8 * 100.0 / 255)
+    else:
+        pi.set_PWM_dutycycle(ena, duty8)
+
+def _write_dirs(pin_levels):
+    """Write any of the direction pins at once: ((pin, 0|1), ...).
+
+    lgpio does it in one group write; pigpio in one clear_bank_1 plus one
+    set_bank_1 (a single register store each) instead of a write per pin.
+    """
+    if _chip is not None:
+        bits = mask = 0
+        for pin, level in pin_levels:
+            bit = 1 << _DIR_PINS.index(pin)
+            mask |= bit
+            if level:
+                bits |= bit
+        lgpio.group_write(_chip, _DIR_PINS[0], bits, mask)
+    else:
+        set_bits = clear_bits = 0
+        for pin, level in pin_levels:
+            if level:
+                set_bits |= 1 << pin
+            else:
+                clear_bits |= 1 << pin
+        if clear_bits:
+            pi.clear_bank_1(clear_bits)
+        if set_bits:
+            pi.set_bank_1(set_bits)
 
 # ----- Motor control -----
-def _set_speed_one(side, speed):
-    """Set speed for one motor side (-1..+1)."""
-    global SPEED_LIMIT
-    s = max(-1.0, min(1.0, float(speed))) * POLARITY[side]
-    mag = abs(s) * SPEED_LIMIT * TRIM[side]
-    ena, in1, in2 = _pins_for(side)
-
-    # Stop case
+def _motor_target(idx, speed, trim):
+    """Map a logical speed (-1..+1) to (direction, duty); (0, 0.0) means stop."""
+    s = max(-1.0, min(1.0, speed)) * MOTORS[idx][3]
+    mag = abs(s) * SPEED_LIMIT * trim
     if mag < 1e-3:
-        pi.write(in1, 0)
-        pi.write(in2, 0)
-        pi.set_PWM_dutycycle(ena, 0)
-        _cur[side]["dir"], _cur[side]["duty"] = 0, 0.0
-        return _cur[side]
-
-    direction = 1 if s > 0 else -1
-    pi.write(in1, 1 if direction > 0 else 0)
-    pi.write(in2, 0 if direction > 0 else 1)
-
+        return 0, 0.0
     mag_boosted = pow(mag, GAMMA)
-    target_duty = DUTY_MIN + (DUTY_MAX - DUTY_MIN) * min(1.0, mag_boosted)
-    duty8 = _duty_to_8bit(target_duty)
-
-    # Kick if starting from rest
-    was_stopped = (_cur[side]["duty"] <= 1e-6)
-    if was_stopped:
-        kick_duty8 = _duty_to_8bit(max(target_duty, START_KICK_DUTY))
-        pi.set_PWM_dutycycle(ena, kick_duty8)
+    return (1 if s > 0 else -1), round(DUTY_MIN + (DUTY_MAX - DUTY_MIN) * min(1.0, mag_boosted), 2)
+
+def _set_speeds(speeds, trims):
+    """Apply both motors (index 0 = L, 1 = R; speeds -1..+1).
+
+    Direction pins for every changed side go out in one batched write,
+    then the PWM duties, so the two sides never sit half-updated.
+    """
+    dirs, pwms, kicked = [], [], []
+    for idx in (0, 1):
+        direction, target_duty = _motor_target(idx, speeds[idx], trims[idx])
+        cur = _cur_idx[idx]
+        # The apply loop re-sends the same setpoint every tick; skip unchanged ones
+        if cur["dir"] == direction and cur["duty"] == target_duty:
+            continue
+        ena, in1, in2, _ = MOTORS[idx]
+        if direction == 0:
+            dirs += ((in1, 0), (in2, 0))
+            pwms.append((ena, 0))
+        else:
+            a = 1 if direction > 0 else 0
+            dirs += ((in1, a), (in2, 1 - a))
+            duty8 = _duty_to_8bit(target_duty)
+            # Kick if starting from rest
+            if cur["duty"] <= 1e-6:
+                pwms.append((ena, _duty_to_8bit(max(target_duty, START_KICK_DUTY))))
+                kicked.append((ena, duty8))
+            else:
+                pwms.append((ena, duty8))
+        cur["dir"], cur["duty"] = direction, target_duty
+    if not dirs:
+        return
+    _write_dirs(dirs)
+    for ena, duty8 in pwms:
+        _set_pwm(ena, duty8)
+    if kicked:
         time.sleep(START_KICK_MS / 1000.0)
-
-    # Normal run
-    pi.set_PWM_dutycycle(ena, duty8)
-    _cur[side]["dir"], _cur[side]["duty"] = direction, target_duty
-    return _cur[side]
+        for ena, duty8 in kicked:
+            _set_pwm(ena, duty8)
 
 
 def stop_all(brake=True):
+    global _stop_gen
     with _motor_lock:
+        for ena, _, _, _ in MOTORS:
+            _set_pwm(ena, 0)
         if brake:
-            pi.write(IN1_A, 1); pi.write(IN2_A, 1); pi.set_PWM_dutycycle(ENA_A, 0)
-            pi.write(IN3_B, 1); pi.write(IN4_B, 1); pi.set_PWM_dutycycle(ENA_B, 0)
+            _write_dirs([(p, 1) for p in _DIR_PINS])
             time.sleep(BRAKE_TIME)
-        for ena, inA, inB in ((ENA_A, IN1_A, IN2_A), (ENA_B, IN3_B, IN4_B)):
-            pi.write(inA, 0)
-            pi.write(inB, 0)
-            pi.set_PWM_dutycycle(ena, 0)
-        _cur["L"] = {"dir": 0, "duty": 0.0}
-        _cur["R"] = {"dir": 0, "duty": 0.0}
+        _write_dirs([(p, 0) for p in _DIR_PINS])
+        for cur in _cur_idx:
+            cur["dir"], cur["duty"] = 0, 0.0
+        _stop_gen += 1
 
 
 # ====== Socket.IO controls (NO WATCHDOG) ======
@@ -221,6 +421,9 @@ _last_drive = {"left": 0.0, "right": 0.0}  # no ts
 def on_connect():
     _clients.add(request.sid)
     print("Client connected:", request.sid, "total:", len(_clients))
+    if not hasattr(sio, "capture_thread"):
+        sio.capture_thread = Thread(target=capture_frames, daemon=True)
+        sio.capture_thread.start()
     if not hasattr(sio, "camera_task"):
         sio.camera_task = sio.start_background_task(stream_camera)
     if not hasattr(sio, "drive_task"):
@@ -255,6 +458,22 @@ def on_drive(data):
         _last_drive["left"], _last_drive["right"] = L, R
     return {"ok": True, "client_ts": client_ts}
 
+@sio.on("drive_bin")
+def on_drive_bin(data):
+    """Compact drive: 2 bytes, int8 left/right in -127..127. Acks 1 byte (1 ok, 0 malformed).
+
+    Skips JSON decoding, float parsing and the dict ack of "drive"; that
+    event stays for debugging.
+    """
+    try:
+        l, r = struct.unpack_from("bb", data)
+    except Exception:
+        return b"\x00"
+    with _drive_lock:
+        _last_drive["left"] = max(-127, l) / 127.0
+        _last_drive["right"] = max(-127, r) / 127.0
+    return b"\x01"
+
 @sio.on("stop")
 def on_stop():
     with _drive_lock:
@@ -265,13 +484,24 @@ def on_stop():
 
 def _drive_apply_loop():
     """Continuously apply the latest setpoints (no watchdog)."""
+    last_applied = None
     while True:
         with _drive_lock:
             L = _last_drive["left"]
             R = _last_drive["right"]
-        with _motor_lock:
-            _set_speed_one("L", L)
-            _set_speed_one("R", R)
+        # nothing to recompute unless the setpoint or a tuning knob moved, or
+        # stop_all zeroed the motors behind our back (stop/disconnect)
+        inputs = (L, R, SPEED_LIMIT, TRIM["L"], TRIM["R"], _stop_gen)
+        if inputs != last_applied:
+            with _motor_lock:
+                _set_speeds((L, R), inputs[3:5])
+            last_applied = inputs
+            # push the new state to every UI; clients don't poll
+            if _clients:
+                try:
+                    sio.emit("status", _status_dict())
+                except Exception:
+                    pass
         sio.sleep(1 / APPLY_HZ)
 
 # ----- status + config -----
@@ -289,11 +519,26 @@ def on_set_speed_limit(data):
         globals()["SPEED_LIMIT"] = max(0.0, min(1.0, v))
         payload = _status_dict()
         # immediately broadcast the fresh state so UIs don't bounce back
-        sio.emit("status", payload, broadcast=True)
+        sio.emit("status", payload)  # server-level emit with no `to` reaches every client
         return payload
     except Exception as e:
         return {"ok": False, "error": "speed_limit must be 0..1: " + str(e)}
 
+@sio.on("set_state")
+def on_set_state(data):
+    """Apply speed_limit and/or trim {"L", "R"} from one message; returns the status dict."""
+    try:
+        if "speed_limit" in data:
+            globals()["SPEED_LIMIT"] = max(0.0, min(1.0, float(data["speed_limit"])))
+        trim = data.get("trim") or {}
+        for k in ("L", "R"):
+            if k in trim:
+                TRIM[k] = max(0.0, min(2.0, float(trim[k])))
+        # the apply loop broadcasts the new status once it reaches the motors
+        return _status_dict()
+    except Exception as e:
+        return {"ok": False, "error": str(e)}
+
 @sio.on("set_trim")
 def on_set_trim(data):
     try:
@@ -319,11 +564,11 @@ def on_servo_set(data):
             SERVO_ANGLE_DEG = _clamp_deg(SERVO_ANGLE_DEG + float(data["delta"]))
         us = _deg_to_us(SERVO_ANGLE_DEG)
         pi.set_servo_pulsewidth(SERVO_PIN, us)
+        # nudges arrive without an ack and clients don't poll: push the new angle
+        sio.emit("status", _status_dict())
         return {"ok": True, "angle": SERVO_ANGLE_DEG, "us": us, "trim_us": SERVO_TRIM_US}
     except Exception as e:
         return {"ok": False, "error": str(e)}
-    
-
 
 def _status_broadcast_loop():
     while True:
@@ -359,7 +604,10 @@ def _status_dict():
 def _on_exit():
     try:
         if picam2:
-            picam2.stop()
+            if _jpeg_sink is not None:
+                picam2.stop_recording()
+            else:
+                picam2.stop()
     except Exception:
         pass
     try:
@@ -370,6 +618,11 @@ def _on_exit():
         stop_all(brake=False)
     except Exception:
         pass
+    try:
+        if _chip is not None:
+            lgpio.gpiochip_close(_chip)
+    except Exception:
+        pass
     try:
         pi.stop()
     except Exception: